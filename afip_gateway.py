@@ -1,12 +1,26 @@
+import threading
+import time
+
 import zeep
 
 from logger import get_logger
 
 from .afip_config import WSNService
+from .models.ticket import TicketAutorizacion
 from .services.wsaa_client import WSAAClient
+from .utils.exceptions import AFIPAuthenticationError
+from .utils.ticket_cache import (
+    get_ticket_cache_path,
+    load_ticket_authorization,
+    save_ticket_authorization,
+)
 
 logger = get_logger(__name__)
 
+# Espera por el ticket persistido de otro proceso cuando WSAA rechaza el login
+TICKET_RESTORE_ATTEMPTS = 5
+TICKET_RESTORE_INTERVAL_SECONDS = 1.0
+
 
 class WSN:
     def __init__(
@@ -16,6 +30,11 @@ class WSN:
         key_path: str,
         is_production: bool = True,
         passphrase: str | None = None,
+        certificate=None,
+        private_key=None,
+        wsaa_soap_client: zeep.Client | None = None,
+        client: zeep.Client | None = None,
+        ticket_cache_dir: str | None = None,
     ):
         """
         Clase que engloba el proceso completo para interactuar con el servicio AFIP.
@@ -26,22 +45,120 @@ class WSN:
             key_path (str): Ruta a la clave privada.
             is_production (bool): Indica si se usa el entorno de producción.
             passphrase (str, opcional): Contraseña de la clave privada, si aplica.
+            certificate (opcional): Certificado ya cargado, para no leerlo de nuevo.
+            private_key (opcional): Clave privada ya cargada, para no leerla de nuevo.
+            wsaa_soap_client (zeep.Client, opcional): Cliente SOAP de WSAA ya creado.
+            client (zeep.Client, opcional): Cliente SOAP del servicio ya creado.
+            ticket_cache_dir (str, opcional): Directorio compartido donde se
+                persisten los tickets, para reutilizarlos entre procesos.
         """
         self.service = service  # Ej: WSNService.WS_SR_CONSTANCIA_INSCRIPCION
         # Extraemos la configuración del servicio a partir del enum
         service_config = service.value
         self.wsaa_client = WSAAClient(
-            service_config.service_name, cert_path, key_path, is_production, passphrase
+            service_config.service_name,
+            cert_path,
+            key_path,
+            is_production,
+            passphrase,
+            certificate=certificate,
+            private_key=private_key,
+            client=wsaa_soap_client,
         )
         self.authorization_ticket = None
+        self.ticket_cache_path = (
+            get_ticket_cache_path(
+                ticket_cache_dir,
+                service_config.service_name,
+                is_production,
+                self.wsaa_client.certificate,
+            )
+            if ticket_cache_dir
+            else None
+        )
+        self._client = client
+        self._client_lock = threading.Lock()
+
+    def get_client(self) -> zeep.Client:
+        """
+        Retorna el cliente SOAP del servicio, creándolo (descarga y parseo del
+        WSDL) sólo en el primer uso.
+
+        El cliente (y su `requests.Session`) se comparte entre todas las llamadas
+        y los hilos que usen esta instancia de WSN.
+
+        Returns:
+            zeep.Client: Cliente SOAP reutilizable para el servicio actual.
+        """
+        with self._client_lock:
+            if self._client is None:
+                wsdl_url = self.get_wsn_url()
+                logger.info(f"Creando cliente SOAP usando WSDL: {wsdl_url}")
+                self._client = zeep.Client(wsdl=wsdl_url)
+            return self._client
+
+    def has_valid_ticket(self) -> bool:
+        """
+        Indica si ya se cuenta con un ticket de autorización vigente.
+        """
+        return (
+            self.authorization_ticket is not None
+            and self.authorization_ticket.is_valid()
+        )
+
+    def restore_authorization_ticket(self) -> bool:
+        """
+        Restaura el ticket de autorización persistido, si existe y sigue vigente.
+
+        Returns:
+            bool: True si se restauró un ticket vigente, False de lo contrario.
+        """
+        if self.ticket_cache_path is None:
+            return False
+        authorization = load_ticket_authorization(self.ticket_cache_path)
+        if authorization is None:
+            return False
+        ticket = TicketAutorizacion(authorization)
+        if not ticket.is_valid():
+            logger.info("El ticket persistido está vencido")
+            return False
+        logger.info(f"Ticket restaurado desde: {self.ticket_cache_path}")
+        self.wsaa_client.authorization = authorization
+        self.authorization_ticket = ticket
+        return True
 
     def obtain_authorization_ticket(self):
         """
         Obtiene el ticket de autorización mediante WSAAClient.
+
+        Si hay un directorio de tickets configurado, primero intenta restaurar el
+        ticket persistido y, tras un login exitoso, lo persiste. WSAA rechaza un
+        nuevo login mientras exista un ticket vigente, por lo que ante un error se
+        espera brevemente a que otro proceso persista el suyo.
         """
+        if self.restore_authorization_ticket():
+            return
         logger.info("Obteniendo ticket de autorización...")
-        self.wsaa_client.authenticate()
+        try:
+            self.wsaa_client.authenticate()
+        except AFIPAuthenticationError:
+            if self._wait_for_persisted_ticket():
+                return
+            raise
         self.authorization_ticket = self.wsaa_client.get_authorization_ticket()
+        if self.ticket_cache_path is not None:
+            save_ticket_authorization(
+                self.ticket_cache_path, self.wsaa_client.authorization
+            )
+
+    def _wait_for_persisted_ticket(self) -> bool:
+        if self.ticket_cache_path is None:
+            return False
+        for _ in range(TICKET_RESTORE_ATTEMPTS):
+            time.sleep(TICKET_RESTORE_INTERVAL_SECONDS)
+            if self.restore_authorization_ticket():
+                return True
+        return False
 
     def request_afip_dummy(self) -> bool:
         """
@@ -50,9 +167,8 @@ class WSN:
         Returns:
             bool: True si el servicio AFIP responde correctamente, False de lo contrario.
         """
-        wsdl_url = self.get_wsn_url()
-        logger.info(f"Solicitando dummy a AFIP usando WSDL: {wsdl_url}")
-        client = zeep.Client(wsdl=wsdl_url)
+        logger.info(f"Solicitando dummy a AFIP usando WSDL: {self.get_wsn_url()}")
+        client = self.get_client()
         try:
             response = client.service.dummy()
             is_operational = (
@@ -75,11 +191,10 @@ class WSN:
         Returns:
             list: Lista de diccionarios con cada ID y su información serializada.
         """
-        if not self.authorization_ticket or not self.authorization_ticket.is_valid():
+        if not self.has_valid_ticket():
             self.obtain_authorization_ticket()
 
-        wsdl_url = self.get_wsn_url()
-        client = zeep.Client(wsdl=wsdl_url)
+        client = self.get_client()
         method_name = self.service.get_method_name()
         personas_list = []
 
@@ -0,0 +1,308 @@
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Iterable
+
+import zeep
+
+from logger import get_logger
+
+from .afip_config import WSNService
+from .afip_gateway import WSN
+from .services.wsaa_client import get_wsaa_wsdl_url
+from .utils.crypto_utils import load_certificate, load_private_key
+
+logger = get_logger(__name__)
+
+ENVIRONMENTS = {"testing": False, "production": True}
+
+
+def _env_name(is_production: bool) -> str:
+    return "production" if is_production else "testing"
+
+
+def _target_name(target: tuple[WSNService, bool]) -> str:
+    service, is_production = target
+    return f"{service.name} ({_env_name(is_production)})"
+
+
+def _wsaa_name(is_production: bool) -> str:
+    return f"WSAA ({_env_name(is_production)})"
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value}")
+    return number
+
+
+@dataclass
+class WarmUpReport:
+    """
+    Resultado del pre-calentamiento de servicios.
+
+    Atributos:
+        services (dict): Instancias WSN preparadas, indexadas por
+            (servicio, is_production). Se incluyen aunque haya fallado la
+            obtención de su ticket, que se reintenta en la primera consulta.
+        stage_durations (dict): Segundos que demoró cada etapa.
+        errors (dict): Excepción de cada tarea que falló, indexada por
+            "etapa: nombre" (por ejemplo "credentials: private_key" o
+            "tickets: WS_SR_PADRON_A13 (production)").
+    """
+
+    services: dict[tuple[WSNService, bool], WSN] = field(default_factory=dict)
+    stage_durations: dict[str, float] = field(default_factory=dict)
+    errors: dict[str, Exception] = field(default_factory=dict)
+
+    @property
+    def is_ready(self) -> bool:
+        return not self.errors
+
+    def has_ticket(self, service: WSNService, is_production: bool) -> bool:
+        wsn = self.services.get((service, is_production))
+        return wsn is not None and wsn.has_valid_ticket()
+
+    def __str__(self) -> str:
+        lines = [
+            f"{stage}: {duration:.3f}s"
+            for stage, duration in self.stage_durations.items()
+        ]
+        for name, error in self.errors.items():
+            lines.append(f"ERROR {name}: {error}")
+        return "\n".join(lines)
+
+
+def _run_stage(
+    report: WarmUpReport,
+    stage: str,
+    tasks: dict[str, Callable[[], object]],
+    executor: ThreadPoolExecutor,
+) -> dict[str, object]:
+    """
+    Ejecuta cada tarea en paralelo, registra la duración de la etapa y los
+    errores, y retorna los resultados de las tareas exitosas.
+    """
+    logger.info(f"Pre-calentamiento: iniciando etapa '{stage}'")
+    start = time.perf_counter()
+    futures = {name: executor.submit(task) for name, task in tasks.items()}
+    results = {}
+    for name, future in futures.items():
+        try:
+            results[name] = future.result()
+        except Exception as e:
+            logger.exception(f"Error en etapa '{stage}' para {name}")
+            report.errors[f"{stage}: {name}"] = e
+    report.stage_durations[stage] = time.perf_counter() - start
+    logger.info(
+        f"Pre-calentamiento: etapa '{stage}' finalizada en "
+        f"{report.stage_durations[stage]:.3f}s"
+    )
+    return results
+
+
+def _obtain_or_restore_ticket(wsn: WSN) -> None:
+    if wsn.has_valid_ticket():
+        logger.info(f"Reutilizando ticket vigente para {wsn.service.name}")
+        return
+    # Restaura el ticket persistido si existe; si no, hace login y lo persiste
+    wsn.obtain_authorization_ticket()
+
+
+def warm_up_services(
+    services: Iterable[WSNService],
+    environments: Iterable[bool],
+    cert_path: str,
+    key_path: str,
+    passphrase: str | None = None,
+    existing: dict[tuple[WSNService, bool], WSN] | None = None,
+    with_tickets: bool = True,
+    ticket_cache_dir: str | None = None,
+    max_workers: int | None = None,
+) -> WarmUpReport:
+    """
+    Prepara de forma concurrente todos los servicios indicados para que las
+    primeras consultas no paguen el costo de arranque en frío.
+
+    Las etapas son: carga de credenciales (una sola vez por llamada), creación
+    de clientes SOAP (un cliente WSAA por entorno, compartido, y uno por
+    servicio) y, opcionalmente, obtención de tickets. Si fallan las
+    credenciales o los clientes de un servicio, éste no se incluye en el
+    resultado; si falla sólo su ticket, se incluye y el error queda en
+    `errors`.
+
+    WSAA rechaza un nuevo login mientras exista un ticket vigente para el mismo
+    certificado y servicio. Con `ticket_cache_dir` los tickets se persisten y
+    se restauran entre procesos, de modo que varios workers (o reinicios)
+    reutilizan el mismo ticket en lugar de pedir uno nuevo.
+
+    Args:
+        services (Iterable[WSNService]): Servicios a preparar.
+        environments (Iterable[bool]): Entornos a preparar (True = producción).
+        cert_path (str): Ruta al certificado AFIP.
+        key_path (str): Ruta a la clave privada.
+        passphrase (str, opcional): Contraseña de la clave privada, si aplica.
+        existing (dict, opcional): Instancias WSN ya creadas; se reutilizan sus
+            clientes y su ticket si sigue vigente.
+        with_tickets (bool): Indica si se obtienen los tickets de autorización.
+        ticket_cache_dir (str, opcional): Directorio compartido donde persistir
+            y restaurar los tickets.
+        max_workers (int, opcional): Cantidad máxima de hilos.
+
+    Returns:
+        WarmUpReport: Instancias preparadas, duración de cada etapa y errores.
+    """
+    targets = [
+        (service, is_production)
+        for service in dict.fromkeys(services)
+        for is_production in dict.fromkeys(environments)
+    ]
+    existing = existing or {}
+    new_targets = [target for target in targets if target not in existing]
+    report = WarmUpReport()
+    total_start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        credentials = {}
+        if new_targets:
+            credentials = _run_stage(
+                report,
+                "credentials",
+                {
+                    "certificate": lambda: load_certificate(cert_path),
+                    "private_key": lambda: load_private_key(key_path, passphrase),
+                },
+                executor,
+            )
+            if len(credentials) < 2:
+                new_targets = []
+
+        prepared = [
+            target for target in targets if target in existing or target in new_targets
+        ]
+        client_tasks = {}
+        for is_production in dict.fromkeys(env for _, env in prepared):
+            wsdl_url = get_wsaa_wsdl_url(is_production)
+            client_tasks[_wsaa_name(is_production)] = (
+                lambda url=wsdl_url: zeep.Client(wsdl=url)
+            )
+        for target in prepared:
+            if target in existing:
+                client_tasks[_target_name(target)] = existing[target].get_client
+            else:
+                service, is_production = target
+                wsdl_url = service.get_environment(is_production).wsdl_url
+                client_tasks[_target_name(target)] = (
+                    lambda url=wsdl_url: zeep.Client(wsdl=url)
+                )
+        clients = _run_stage(report, "clients", client_tasks, executor)
+
+        wsns = {}
+        for target in prepared:
+            service, is_production = target
+            wsaa_soap_client = clients.get(_wsaa_name(is_production))
+            client = clients.get(_target_name(target))
+            if wsaa_soap_client is None or client is None:
+                continue
+            if target in existing:
+                # Sólo se asigna si la instancia todavía no tenía cliente WSAA
+                existing[target].wsaa_client.set_client(wsaa_soap_client)
+                wsns[target] = existing[target]
+                continue
+            wsns[target] = WSN(
+                service,
+                cert_path,
+                key_path,
+                is_production,
+                passphrase,
+                certificate=credentials["certificate"],
+                private_key=credentials["private_key"],
+                wsaa_soap_client=wsaa_soap_client,
+                client=client,
+                ticket_cache_dir=ticket_cache_dir,
+            )
+
+        if with_tickets:
+            _run_stage(
+                report,
+                "tickets",
+                {
+                    _target_name(target): (
+                        lambda wsn=wsn: _obtain_or_restore_ticket(wsn)
+                    )
+                    for target, wsn in wsns.items()
+                },
+                executor,
+            )
+
+    report.services = wsns
+    report.stage_durations["total"] = time.perf_counter() - total_start
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Pre-calienta servicios AFIP: credenciales, WSDLs y tickets."
+    )
+    parser.add_argument("--cert", required=True, help="Ruta al certificado AFIP")
+    parser.add_argument("--key", required=True, help="Ruta a la clave privada")
+    parser.add_argument("--passphrase", default=None, help="Contraseña de la clave")
+    parser.add_argument(
+        "--service",
+        dest="services",
+        action="append",
+        choices=[service.name for service in WSNService],
+        help="Servicio a preparar (repetible). Por defecto, todos.",
+    )
+    parser.add_argument(
+        "--env",
+        dest="environments",
+        action="append",
+        choices=list(ENVIRONMENTS),
+        help="Entorno a preparar (repetible). Por defecto, production.",
+    )
+    parser.add_argument(
+        "--ticket-cache-dir",
+        default=None,
+        help="Directorio compartido con los workers donde se persisten los tickets.",
+    )
+    parser.add_argument(
+        "--with-tickets",
+        action="store_true",
+        help=(
+            "Obtiene también los tickets y los persiste en --ticket-cache-dir "
+            "para que los workers los restauren al iniciar."
+        ),
+    )
+    parser.add_argument("--max-workers", type=_positive_int, default=None)
+    args = parser.parse_args(argv)
+    if args.with_tickets and not args.ticket_cache_dir:
+        # Sin persistencia el ticket se perdería al terminar y WSAA rechazaría
+        # el login de los workers mientras siga vigente
+        parser.error("--with-tickets requires --ticket-cache-dir")
+
+    services = (
+        [WSNService[name] for name in args.services]
+        if args.services
+        else list(WSNService)
+    )
+    environments = [ENVIRONMENTS[env] for env in args.environments or ["production"]]
+
+    report = warm_up_services(
+        services,
+        environments,
+        args.cert,
+        args.key,
+        args.passphrase,
+        with_tickets=args.with_tickets,
+        ticket_cache_dir=args.ticket_cache_dir,
+        max_workers=args.max_workers,
+    )
+    print(report)
+    return 0 if report.is_ready else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
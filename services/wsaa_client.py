@@ -1,3 +1,5 @@
+import threading
+
 import xmltodict
 import zeep
 
@@ -12,6 +14,12 @@ from ..utils.tra_utils import create_tra_xml
 logger = get_logger(__name__)
 
 
+def get_wsaa_wsdl_url(is_production: bool) -> str:
+    if is_production:
+        return "https://wsaa.afip.gov.ar/ws/services/LoginCms?WSDL"
+    return "https://wsaahomo.afip.gov.ar/ws/services/LoginCms?WSDL"
+
+
 class WSAAClient:
     def __init__(
         self,
@@ -20,32 +28,73 @@ class WSAAClient:
         private_key_path: str,
         is_production: bool = True,
         passphrase: str | None = None,
+        certificate=None,
+        private_key=None,
+        client: zeep.Client | None = None,
     ):
+        """
+        Cliente de autenticación WSAA.
+
+        `certificate`, `private_key` y `client` permiten reutilizar credenciales
+        ya cargadas y un cliente SOAP ya creado (por ejemplo, compartidos entre
+        varios servicios); si no se proveen, se cargan/crean a partir de las rutas
+        y el entorno indicados.
+        """
         logger.info(f"Inicializando WSAAClient para el servicio: {service_name}")
         self.service_name = service_name
-        try:
-            self.certificate = load_certificate(certificate_path)
-            logger.info("Certificado cargado correctamente")
-        except Exception as e:
-            logger.exception(
-                f"Error al cargar el certificado desde: {certificate_path}"
-            )
-            raise e
-        try:
-            self.private_key = load_private_key(private_key_path, passphrase)
-            logger.info("Clave privada cargada correctamente")
-        except Exception as e:
-            logger.exception(
-                f"Error al cargar la clave privada desde: {private_key_path}"
-            )
-            raise e
+        if certificate is not None:
+            self.certificate = certificate
+        else:
+            try:
+                self.certificate = load_certificate(certificate_path)
+                logger.info("Certificado cargado correctamente")
+            except Exception as e:
+                logger.exception(
+                    f"Error al cargar el certificado desde: {certificate_path}"
+                )
+                raise e
+        if private_key is not None:
+            self.private_key = private_key
+        else:
+            try:
+                self.private_key = load_private_key(private_key_path, passphrase)
+                logger.info("Clave privada cargada correctamente")
+            except Exception as e:
+                logger.exception(
+                    f"Error al cargar la clave privada desde: {private_key_path}"
+                )
+                raise e
         self.is_production = is_production
         self.authorization = None
+        self._client = client
+        self._client_lock = threading.Lock()
+
+    def get_client(self) -> zeep.Client:
+        """
+        Retorna el cliente SOAP de WSAA, creándolo sólo en el primer uso.
+
+        El cliente (y su `requests.Session`) se comparte entre todas las llamadas
+        y los hilos que usen esta instancia.
+        """
+        with self._client_lock:
+            if self._client is None:
+                wsdl_url = self.get_wsdl_url()
+                logger.info(f"Creando cliente WSAA usando WSDL: {wsdl_url}")
+                self._client = zeep.Client(wsdl=wsdl_url)
+            return self._client
+
+    def set_client(self, client: zeep.Client) -> None:
+        """
+        Asigna un cliente SOAP de WSAA ya creado, si esta instancia aún no tiene uno.
+        """
+        with self._client_lock:
+            if self._client is None:
+                self._client = client
 
     def request_afip_authorization(self, cms_base64: str) -> dict:
         wsdl_url = self.get_wsdl_url()
         logger.info(f"Solicitando autorización AFIP usando WSDL: {wsdl_url}")
-        client = zeep.Client(wsdl=wsdl_url)
+        client = self.get_client()
         try:
             response = client.service.loginCms(in0=cms_base64)
             logger.info("Respuesta recibida del servicio AFIP")
@@ -55,10 +104,7 @@ class WSAAClient:
             raise AFIPAuthenticationError(f"Error when calling AFIP service: {str(e)}")
 
     def get_wsdl_url(self) -> str:
-        if self.is_production:
-            url = "https://wsaa.afip.gov.ar/ws/services/LoginCms?WSDL"
-        else:
-            url = "https://wsaahomo.afip.gov.ar/ws/services/LoginCms?WSDL"
+        url = get_wsaa_wsdl_url(self.is_production)
         logger.debug(f"Utilizando URL de WSDL: {url}")
         return url
 
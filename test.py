@@ -1,26 +1,32 @@
 from afip_config import WSNService
-from afip_gateway import WSN
-
-
-def initialize_services(certificate_path, private_key_path, is_production, passphrase):
-    wsn_inscription_service = WSN(
-        WSNService.WS_SR_CONSTANCIA_INSCRIPCION,
-        certificate_path,
-        private_key_path,
-        is_production,
-        passphrase,
-    )
-    wsn_inscription_service.obtain_authorization_ticket()
-
-    wsn_padron_service = WSN(
-        WSNService.WS_SR_PADRON_A13,
+from afip_warmup import warm_up_services
+
+
+def initialize_services(
+    certificate_path,
+    private_key_path,
+    is_production,
+    passphrase,
+    ticket_cache_dir=None,
+):
+    # Prepara ambos servicios en paralelo (credenciales, WSDLs y tickets)
+    report = warm_up_services(
+        [WSNService.WS_SR_CONSTANCIA_INSCRIPCION, WSNService.WS_SR_PADRON_A13],
+        [is_production],
         certificate_path,
         private_key_path,
-        is_production,
         passphrase,
+        ticket_cache_dir=ticket_cache_dir,
     )
-    wsn_padron_service.obtain_authorization_ticket()
-
+    print(report)
+    # Un error de ticket no es fatal: se reintenta en la primera consulta
+    if len(report.services) < 2:
+        raise RuntimeError(f"Warm-up failed:\n{report}")
+
+    wsn_inscription_service = report.services[
+        (WSNService.WS_SR_CONSTANCIA_INSCRIPCION, is_production)
+    ]
+    wsn_padron_service = report.services[(WSNService.WS_SR_PADRON_A13, is_production)]
     return wsn_inscription_service, wsn_padron_service
 
 
@@ -58,10 +64,12 @@ if __name__ == "__main__":
         True
     )
     passphrase = "passphrase"  # os.getenv("PASSPHRASE")
+    # Tickets persistidos para reutilizarlos entre ejecuciones
+    ticket_cache_dir = "tickets"  # os.getenv("TICKET_CACHE_DIR")
 
     # Initialize services
     wsn_inscription_service, wsn_padron_service = initialize_services(
-        certificate_path, private_key_path, is_production, passphrase
+        certificate_path, private_key_path, is_production, passphrase, ticket_cache_dir
     )
 
     # Example CUITs LIMITE MAXIMO 250
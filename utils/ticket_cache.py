@@ -0,0 +1,45 @@
+import json
+import os
+import tempfile
+
+from cryptography.hazmat.primitives import hashes
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def get_ticket_cache_path(
+    cache_dir: str, service_name: str, is_production: bool, certificate
+) -> str:
+    environment = "production" if is_production else "testing"
+    fingerprint = certificate.fingerprint(hashes.SHA256()).hex()[:16]
+    return os.path.join(cache_dir, f"{service_name}-{environment}-{fingerprint}.json")
+
+
+def load_ticket_authorization(cache_path: str) -> dict | None:
+    logger.debug(f"Buscando ticket persistido en: {cache_path}")
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path, "r", encoding="utf-8") as cache_file:
+            return json.load(cache_file)
+    except Exception:
+        logger.exception(f"Error al leer el ticket persistido: {cache_path}")
+        return None
+
+
+def save_ticket_authorization(cache_path: str, authorization: dict) -> None:
+    logger.debug(f"Persistiendo ticket en: {cache_path}")
+    cache_dir = os.path.dirname(cache_path) or "."
+    os.makedirs(cache_dir, exist_ok=True)
+    # Escritura atómica: otro proceso nunca lee un archivo a medio escribir
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+            json.dump(authorization, tmp_file)
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        os.remove(tmp_path)
+        raise
+    logger.info(f"Ticket persistido en: {cache_path}")